@@ -2,7 +2,10 @@
 Extended `packaging.version.Version` implementation.
 """
 
-from typing import Any, Optional, Union
+import functools
+import re
+from collections.abc import Iterable
+from typing import Any, Final, Optional, Union
 
 import packaging.version
 from typing_extensions import Self
@@ -16,6 +19,28 @@ from newversion.type_defs import (
     ReleaseMainTypeDef,
 )
 
+_PRERELEASE_LETTERS: Final = {
+    "alpha": Prerelease.A,
+    "a": Prerelease.A,
+    "beta": Prerelease.B,
+    "b": Prerelease.B,
+    "rc": Prerelease.RC,
+    "c": Prerelease.RC,
+}
+_PRERELEASE_TYPES: Final[dict[str, PrereleaseTypeDef]] = {
+    Prerelease.RC: VersionParts.RC.value,
+    Prerelease.A: VersionParts.ALPHA.value,
+    Prerelease.B: VersionParts.BETA.value,
+}
+# packaging>=26 keeps version parts in slots and computes `_key` on demand,
+# parse cache and plain release fast path are used only with older packaging
+_PARENT_SLOTS: Final[tuple[str, ...]] = vars(packaging.version.Version).get("__slots__", ())
+_SLOTTED_PARENT: Final = bool(_PARENT_SLOTS)
+_ZERO_VERSION: Final = packaging.version.Version("0")
+_RELEASE_CHARS: Final = frozenset("0123456789.")
+_LOCAL_RE: Final = re.compile(r"[a-z0-9]+(?:[-_\.][a-z0-9]+)*", re.IGNORECASE)
+_LOCAL_SEPARATOR_RE: Final = re.compile(r"[-_\.]")
+
 
 class VersionError(packaging.version.InvalidVersion):
     """
@@ -23,17 +48,224 @@ class VersionError(packaging.version.InvalidVersion):
     """
 
 
+def _get_release_base(release: tuple[int, ...]) -> BaseVersion:
+    """
+    Create underlying version NamedTuple with only release segment set.
+    """
+    return BaseVersion(0, release, None, None, None, None)
+
+
+def _get_main_release(release: tuple[int, ...]) -> tuple[int, int, int]:
+    """
+    Get major, minor and micro release numbers, missing ones are zero.
+    """
+    major, minor, micro = (*release, 0, 0)[:3]
+    return major, minor, micro
+
+
+def _render_base(base: BaseVersion) -> str:
+    """
+    Render underlying version NamedTuple to string, even if it is not a valid version.
+    """
+    result = ".".join(map(str, base.release))
+    if base.epoch:
+        result = f"{base.epoch}!{result}"
+    if base.pre:
+        result += "".join(map(str, base.pre))
+    if base.post:
+        result += f".post{base.post[1]}"
+    if base.dev:
+        result += f".dev{base.dev[1]}"
+    if base.local:
+        result += "+" + ".".join(map(str, base.local))
+    return result
+
+
+def _normalize_base(base: BaseVersion) -> BaseVersion:
+    """
+    Normalize underlying version NamedTuple the same way as parsing its string would.
+
+    Negative pre-, post- and dev release numbers become positive,
+    as `1.2.3.dev-1` is parsed as `1.2.3.dev1`.
+
+    Raises:
+        VersionError: If epoch or release number is negative.
+    """
+    if base.epoch < 0 or min(base.release) < 0:
+        message = f"Invalid version: {_render_base(base)!r}"
+        raise VersionError(message)
+
+    pre, post, dev = (
+        (part[0], abs(part[1])) if part else part for part in (base.pre, base.post, base.dev)
+    )
+    if pre != base.pre or post != base.post or dev != base.dev:
+        return base._replace(pre=pre, post=post, dev=dev)
+    return base
+
+
+def _get_prerelease_letter(prerelease_type: str) -> str:
+    """
+    Get normalized pre-release letter for pre-release type.
+
+    Raises:
+        VersionError: If pre-release type is unknown.
+    """
+    letter = _PRERELEASE_LETTERS.get(prerelease_type)
+    if letter is None:
+        message = f"Invalid pre-release type: {prerelease_type!r}"
+        raise VersionError(message)
+    return letter
+
+
+def _get_key(base: BaseVersion) -> tuple[Any, ...]:
+    """
+    Get comparison key for underlying version NamedTuple.
+    """
+    return packaging.version._cmpkey(  # pyright: ignore[reportPrivateUsage]
+        base.epoch,
+        base.release,
+        base.pre,
+        base.post,
+        base.dev,
+        base.local,
+    )
+
+
+def _get_replace_parts(base: BaseVersion) -> dict[str, Any]:
+    """
+    Get `packaging.version.Version.__replace__` arguments for underlying version NamedTuple.
+    """
+    return {
+        "epoch": base.epoch,
+        "release": base.release,
+        "pre": base.pre,
+        "post": base.post[1] if base.post else None,
+        "dev": base.dev[1] if base.dev else None,
+        "local": ".".join(map(str, base.local)) if base.local else None,
+    }
+
+
+def _parse_release(version: str) -> Optional[tuple[int, ...]]:
+    """
+    Parse plain release version like `1.2.3` without PEP 440 regex matching.
+
+    Returns:
+        Release numbers or None if version is not a plain release.
+    """
+    if _RELEASE_CHARS.issuperset(version) and "" not in (parts := version.split(".")):
+        return tuple(map(int, parts))
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_base(version: str) -> tuple[BaseVersion, tuple[Any, ...]]:
+    """
+    Parse version string to underlying NamedTuple and comparison key.
+
+    Results are cached, so repeated parsing of the same string is a dict lookup.
+    Plain release versions like `1.2.3` skip PEP 440 regex matching.
+    Used only with packaging<26, newer versions keep parts in slots.
+
+    Raises:
+        InvalidVersion: If version string does not conform to PEP 440.
+    """
+    release = _parse_release(version)
+    if release is not None:
+        base = _get_release_base(release)
+        return base, _get_key(base)
+
+    parsed = packaging.version.Version(version)
+    return (
+        BaseVersion(*parsed._version),  # pyright: ignore[reportPrivateUsage]
+        parsed._key,  # pyright: ignore[reportPrivateUsage]
+    )
+
+
+def _get_sort_key(version: str) -> tuple[Any, ...]:
+    """
+    Get comparison key for version string.
+
+    Does not use `_parse_base` cache, so bulk sorting does not evict cached versions.
+
+    Raises:
+        InvalidVersion: If version string does not conform to PEP 440.
+    """
+    release = _parse_release(version)
+    if release is not None:
+        return _get_key(_get_release_base(release))
+    return packaging.version.Version(version)._key  # pyright: ignore[reportPrivateUsage]
+
+
+def _parse_local(local: str) -> tuple[Union[int, str], ...]:
+    """
+    Parse local version identifier to normalized parts.
+
+    Raises:
+        VersionError: If local version identifier does not conform to PEP 440.
+    """
+    if not _LOCAL_RE.fullmatch(local):
+        message = f"Invalid local version: {local!r}"
+        raise VersionError(message)
+    return tuple(
+        int(part) if part.isdigit() else part.lower() for part in _LOCAL_SEPARATOR_RE.split(local)
+    )
+
+
 class Version(packaging.version.Version):
     """
     Extended `packaging.version.Version` implementation.
     """
 
+    __slots__ = ()
+
     def __init__(self, version: str) -> None:
         try:
-            super().__init__(version)
+            if _SLOTTED_PARENT:
+                super().__init__(version)
+            else:
+                self._version, self._key = _parse_base(version)
+                self._hash_cache: Optional[int] = None
         except packaging.version.InvalidVersion as e:
             raise VersionError(e) from None
 
+    if not _SLOTTED_PARENT:
+        # packaging>=26.1 caches hash itself, 26.0 has no slot to cache it in
+        def __hash__(self) -> int:
+            """
+            Get hash of comparison key, cached on the instance.
+            """
+            if self._hash_cache is None:
+                self._hash_cache = hash(self._key)
+            return self._hash_cache
+
+    def __reduce__(self) -> tuple[type[Self], tuple[str]]:
+        """
+        Pickle as a version string, cached hash is not valid in other processes.
+        """
+        return self.__class__, (self.dumps(),)
+
+    def __setstate__(self, state: object) -> None:
+        """
+        Load pickles created before versions were pickled as strings.
+        """
+        if isinstance(state, dict) and "_version" in state:
+            self._set_base(BaseVersion(*state["_version"]))
+            return
+
+        if hasattr(packaging.version.Version, "__setstate__"):
+            packaging.version.Version.__setstate__(self, state)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+            return
+
+        # packaging 26.0 and 26.1 pickle slots as `(None, {slot: value})`
+        slots = state[-1] if isinstance(state, tuple) and state else None  # pyright: ignore[reportUnknownVariableType]
+        if isinstance(slots, dict):
+            for name in _PARENT_SLOTS:
+                setattr(self, name, slots.get(name))  # pyright: ignore[reportUnknownMemberType]
+            return
+
+        message = f"Cannot restore Version from {state!r}"
+        raise TypeError(message)
+
     @classmethod
     def zero(cls) -> Self:
         """
@@ -41,6 +273,34 @@ class Version(packaging.version.Version):
         """
         return cls("0.0.0")
 
+    @classmethod
+    def sort_many(cls, versions: Iterable[str]) -> list[str]:
+        """
+        Sort version strings in PEP 440 order.
+
+        Each string is parsed once to get its comparison key. Plain releases like `1.2.3`
+        skip regex matching, and the parse cache used by `Version()` is left untouched.
+
+        Examples:
+            ```python
+            Version.sort_many(["1.2.3", "1.2.3rc1", "1.10.0", "1.2.3.dev4"])
+            # ["1.2.3.dev4", "1.2.3rc1", "1.2.3", "1.10.0"]
+            ```
+
+        Arguments:
+            versions: Version strings.
+
+        Returns:
+            A new sorted list of version strings.
+
+        Raises:
+            VersionError: If any version string does not conform to PEP 440.
+        """
+        try:
+            return sorted(versions, key=_get_sort_key)
+        except packaging.version.InvalidVersion as e:
+            raise VersionError(e) from None
+
     def dumps(self) -> str:
         """
         Render to string.
@@ -52,40 +312,66 @@ class Version(packaging.version.Version):
         """
         Repease type as VersionParts.
         """
-        if not self.pre:
-            return None
-
-        letter = self.pre[0]
-        if letter == Prerelease.RC:
-            return VersionParts.RC.value
-        if letter == Prerelease.A:
-            return VersionParts.ALPHA.value
-        if letter == Prerelease.B:
-            return VersionParts.BETA.value
-
-        return None
+        pre = self.pre
+        return _PRERELEASE_TYPES.get(pre[0]) if pre else None
 
     @property
     def base(self) -> BaseVersion:
         """
         Underlying version NamedTuple.
         """
-        return self._version
+        if not _SLOTTED_PARENT:
+            return self._version
+
+        post, dev, local = self.post, self.dev, self.local
+        return BaseVersion(
+            epoch=self.epoch,
+            release=self.release,
+            dev=None if dev is None else (VersionParts.DEV.value, dev),
+            pre=self.pre,
+            post=None if post is None else (VersionParts.POST.value, post),
+            local=None if local is None else _parse_local(local),
+        )
 
     @base.setter
     def base(self, base: BaseVersion) -> None:
-        self._version = base
+        self._set_base(base)
+
+    def _set_base(self, base: BaseVersion) -> None:
+        if not _SLOTTED_PARENT:
+            self._version = base
+            self._key = _get_key(base)
+            self._hash_cache = None
+            return
+
+        # `_version` is deprecated, public `__replace__` builds and validates slots
+        try:
+            version = _ZERO_VERSION.__replace__(**_get_replace_parts(base))  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+        except packaging.version.InvalidVersion as e:
+            raise VersionError(e) from None
+        self._set_slots(version)  # pyright: ignore[reportUnknownArgumentType]
+
+    def _set_slots(self, version: packaging.version.Version) -> None:
+        for name in _PARENT_SLOTS:
+            setattr(self, name, getattr(version, name))
 
     def copy(self) -> Self:
         """
         Create a copy of a current version instance.
         """
-        return self.__class__(self.dumps())
+        new_version = self.__class__.__new__(self.__class__)
+        if _SLOTTED_PARENT:
+            new_version._set_slots(self)
+        else:
+            new_version._version = self._version
+            new_version._key = self._key
+            new_version._hash_cache = self._hash_cache
+        return new_version
 
     def _replace(self, base: BaseVersion) -> Self:
-        new_version = self.copy()
-        new_version.base = base
-        return new_version.copy()
+        new_version = self.__class__.__new__(self.__class__)
+        new_version._set_base(_normalize_base(base))
+        return new_version
 
     def bump_release(
         self,
@@ -135,19 +421,11 @@ class Version(packaging.version.Version):
         Returns:
             A new copy.
         """
-        if not self.is_stable and self.minor == 0 and self.micro == 0:
+        major, minor, micro = _get_main_release(self.release)
+        if not self.is_stable and minor == 0 and micro == 0:
             return self.get_stable().bump_major(inc - 1)
 
-        return self._replace(
-            BaseVersion(
-                epoch=0,
-                release=(self.major + inc, 0, 0),
-                pre=None,
-                post=None,
-                dev=None,
-                local=None,
-            )
-        )
+        return self._replace(_get_release_base((major + inc, 0, 0)))
 
     def bump_minor(self, inc: int = 1) -> Self:
         """
@@ -170,19 +448,11 @@ class Version(packaging.version.Version):
         Returns:
             A new copy.
         """
-        if not self.is_stable and self.micro == 0:
+        major, minor, micro = _get_main_release(self.release)
+        if not self.is_stable and micro == 0:
             return self.get_stable().bump_minor(inc - 1)
 
-        return self._replace(
-            BaseVersion(
-                epoch=0,
-                release=(self.major, self.minor + inc, 0),
-                pre=None,
-                post=None,
-                dev=None,
-                local=None,
-            )
-        )
+        return self._replace(_get_release_base((major, minor + inc, 0)))
 
     def bump_micro(self, inc: int = 1) -> Self:
         """
@@ -206,16 +476,8 @@ class Version(packaging.version.Version):
         if not self.is_stable:
             return self.get_stable().bump_micro(inc - 1)
 
-        return self._replace(
-            BaseVersion(
-                epoch=0,
-                release=(self.major, self.minor, self.micro + inc),
-                pre=None,
-                post=None,
-                dev=None,
-                local=None,
-            )
-        )
+        major, minor, micro = _get_main_release(self.release)
+        return self._replace(_get_release_base((major, minor, micro + inc)))
 
     def bump_dev(
         self,
@@ -251,15 +513,33 @@ class Version(packaging.version.Version):
             dev_version = self.dev or 0
             return self.replace(dev=(dev_version + inc))
 
+        dev = (VersionParts.DEV.value, inc - 1)
+        major, minor, micro = _get_main_release(self.release)
         if bump_release == VersionParts.POST.value or self.is_postrelease:
             # this is a postrelease or we want to create one
-            return self.bump_postrelease().replace(dev=(inc - 1))
-
-        if self.is_stable:
+            release = (major, minor, micro)
+            post = self._get_next_post(1)
+        elif self.is_stable:
             # this is a stable release and we want to bump the release and add dev
-            return self.bump_release(bump_release).replace(dev=(inc - 1))
+            if bump_release == VersionParts.MAJOR.value:
+                release = (major + 1, 0, 0)
+            elif bump_release == VersionParts.MINOR.value:
+                release = (major, minor + 1, 0)
+            else:
+                release = (major, minor, micro + 1)
+            post = None
+        else:
+            return self.replace(dev=(inc - 1))
 
-        return self.replace(dev=(inc - 1))
+        base = BaseVersion(
+            epoch=0,
+            release=release,
+            pre=None,
+            post=post,
+            dev=dev,
+            local=None,
+        )
+        return self._replace(base)
 
     def bump_prerelease(
         self,
@@ -289,12 +569,17 @@ class Version(packaging.version.Version):
 
         Returns:
             A new copy.
+
+        Raises:
+            VersionError: If pre-release type is unknown.
         """
         prerelease_type = release_type or self.prerelease_type or VersionParts.RC.value
-        increment = inc if not self.base.pre else (max(self.base.pre[-1], 1) + inc)
-        pre = (prerelease_type, increment)
+        base_pre = self.pre
+        # parsed numbers are never negative, `1.2.3a` is parsed as `1.2.3a0`
+        increment = (base_pre[-1] or 1) + inc if base_pre else inc
+        pre = (_get_prerelease_letter(prerelease_type), increment)
 
-        new_version = self._replace(self._copy_base(pre=pre))
+        new_version = self._replace(self.base._replace(pre=pre))
         if new_version < self:
             prerelease_type = release_type or VersionParts.RC.value
             new_version = self.get_stable().bump_release(bump_release)
@@ -305,7 +590,7 @@ class Version(packaging.version.Version):
         base = BaseVersion(
             epoch=0,
             release=new_version.base.release,
-            pre=(prerelease_type, increment),
+            pre=(_get_prerelease_letter(prerelease_type), increment),
             post=None,
             dev=None,
             local=None,
@@ -330,20 +615,24 @@ class Version(packaging.version.Version):
         Returns:
             A new copy.
         """
-        post = (VersionParts.POST.value, max(inc, 1))
-        base_post: Optional[tuple[str, int]] = self._version.post
-        if base_post:
-            post = (VersionParts.POST.value, max(base_post[1], 1) + inc)
         base = BaseVersion(
             epoch=0,
-            release=self._version.release,
+            release=self.release,
             pre=None,
-            post=post,
+            post=self._get_next_post(inc),
             dev=None,
             local=None,
         )
         return self._replace(base)
 
+    def _get_next_post(self, inc: int) -> tuple[str, int]:
+        base_post = self.post
+        if base_post is not None:
+            # parsed numbers are never negative, `1.2.3.post` is parsed as `1.2.3.post0`
+            return (VersionParts.POST.value, (base_post or 1) + inc)
+
+        return (VersionParts.POST.value, max(inc, 1))
+
     def replace(
         self,
         major: Optional[int] = None,
@@ -382,19 +671,17 @@ class Version(packaging.version.Version):
         Returns:
             A new instance.
         """
+        base_major, base_minor, base_micro = _get_main_release(self.release)
         kwargs: dict[str, Any] = {
             "release": (
-                major if major is not None else self.major,
-                minor if minor is not None else self.minor,
-                micro if micro is not None else self.micro,
+                major if major is not None else base_major,
+                minor if minor is not None else base_minor,
+                micro if micro is not None else base_micro,
             )
         }
-        if alpha is not None:
-            kwargs[VersionParts.PRE.value] = (VersionParts.ALPHA.value, alpha)
-        if beta is not None:
-            kwargs[VersionParts.PRE.value] = (VersionParts.BETA.value, beta)
-        if rc is not None:
-            kwargs[VersionParts.PRE.value] = (VersionParts.RC.value, rc)
+        for letter, number in ((Prerelease.A, alpha), (Prerelease.B, beta), (Prerelease.RC, rc)):
+            if number is not None:
+                kwargs[VersionParts.PRE.value] = (letter, number)
         if dev is not None:
             kwargs[VersionParts.DEV.value] = (VersionParts.DEV.value, dev)
         if post is not None:
@@ -402,9 +689,14 @@ class Version(packaging.version.Version):
         if epoch is not None:
             kwargs[VersionParts.EPOCH.value] = epoch
         if local is not None:
-            kwargs[VersionParts.LOCAL.value] = [local]
+            try:
+                kwargs[VersionParts.LOCAL.value] = _parse_local(local)
+            except VersionError:
+                invalid_base = self.base._replace(**kwargs, local=(local,))
+                message = f"Invalid version: {_render_base(invalid_base)!r}"
+                raise VersionError(message) from None
 
-        return self._replace(self._copy_base(**kwargs))
+        return self._replace(self.base._replace(**kwargs))
 
     @property
     def is_stable(self) -> bool:
@@ -430,32 +722,4 @@ class Version(packaging.version.Version):
         Returns:
             A new instance.
         """
-        return self._replace(
-            BaseVersion(
-                epoch=0,
-                release=(self.major, self.minor, self.micro),
-                pre=None,
-                post=None,
-                dev=None,
-                local=None,
-            )
-        )
-
-    def _copy_base(
-        self,
-        *,
-        epoch: Optional[int] = None,
-        release: Optional[tuple[int, ...]] = None,
-        dev: Optional[tuple[str, int]] = None,
-        pre: Optional[tuple[str, int]] = None,
-        post: Optional[tuple[str, int]] = None,
-        local: Optional[tuple[Union[int, str], ...]] = None,
-    ) -> BaseVersion:
-        return BaseVersion(
-            epoch=epoch if epoch is not None else self.base.epoch,
-            release=release if release is not None else self.base.release,
-            pre=pre if pre is not None else self.base.pre,
-            post=post if post is not None else self.base.post,
-            dev=dev if dev is not None else self.base.dev,
-            local=local if local is not None else self.base.local,
-        )
+        return self._replace(_get_release_base(_get_main_release(self.release)))
@@ -1,3 +1,5 @@
+import pickle  # noqa: S403
+
 import pytest
 
 from newversion.version import Version, VersionError
@@ -26,6 +28,33 @@ class TestVersion:
         with pytest.raises(VersionError):
             Version("invalid")
 
+    def test_parse_cached(self) -> None:
+        version = Version("1.2.3rc4")
+        other = Version("1.2.3rc4")
+        assert version is not other
+        assert version.base == other.base
+        version.base = Version("2.0.0").base
+        assert Version("1.2.3rc4").dumps() == "1.2.3rc4"
+        with pytest.raises(VersionError):
+            Version("1.2.3-invalid")
+        assert Version("01.2.3.4") == Version("1.2.3.4")
+        assert Version("01.2.3.4").base.release == (1, 2, 3, 4)
+        for invalid in ("", "1..2", ".1", "1."):
+            with pytest.raises(VersionError):
+                Version(invalid)
+
+    def test_base_setter(self) -> None:
+        version = Version("1.2.3rc4")
+        assert version.prerelease_type == "rc"
+        assert not version.is_stable
+        assert version.get_stable().dumps() == "1.2.3"
+        version.base = Version("1.2.3").base
+        assert version.prerelease_type is None
+        assert version.is_stable
+        assert version == Version("1.2.3")
+        version.base = Version("2.3.4b1").base
+        assert version.get_stable().dumps() == "2.3.4"
+
     def test_bump_major(self) -> None:
         assert Version.zero().bump_major().dumps() == "1.0.0"
         assert Version("1.2.3").bump_major().dumps() == "2.0.0"
@@ -65,6 +94,10 @@ class TestVersion:
         assert Version("1.2.3").bump_prerelease(2, "alpha", "major").dumps() == "2.0.0a2"
         assert Version("1.2.3a3").bump_prerelease(2, "alpha", "major").dumps() == "1.2.3a5"
         assert Version("1.2.3a3").bump_prerelease(2, "rc", "major").dumps() == "1.2.3rc2"
+        assert Version("1.2.3").bump_prerelease(0).dumps() == "1.2.4rc0"
+        assert Version("1.2.3").bump_prerelease(-1).dumps() == "1.2.4rc1"
+        with pytest.raises(VersionError):
+            Version("1.2.3").bump_prerelease(1, "gamma")  # pyright: ignore[reportArgumentType]
 
     def test_bump_postrelease(self) -> None:
         assert Version("1.2.3").bump_postrelease().dumps() == "1.2.3.post1"
@@ -89,6 +122,9 @@ class TestVersion:
         assert Version("1.2.3dev4").bump_dev(1, "major").dumps() == "1.2.3.dev5"
         # this also tests correcting an incorrect beta `.`
         assert Version("4.5.6.b6.dev33").bump_dev().dumps() == "4.5.6b6.dev34"
+        assert Version("1.2.3").bump_dev(0).dumps() == "1.2.4.dev1"
+        assert Version("1.2.3rc3").bump_dev(0).dumps() == "1.2.3rc3.dev1"
+        assert Version("1.2.3.post1").bump_dev(0).dumps() == "1.2.3.post2.dev1"
 
     def test_replace(self) -> None:
         assert Version("1.2.3").replace(dev=45).dumps() == "1.2.3.dev45"
@@ -97,6 +133,17 @@ class TestVersion:
         assert Version("1.2.3rc3").replace(dev=45).dumps() == "1.2.3rc3.dev45"
         assert Version("1.2.3rc3").replace(major=3).dumps() == "3.2.3rc3"
         assert Version("1.2.3rc3").replace(local="test-1").dumps() == "1.2.3rc3+test.1"
+        assert Version("1.2.3rc3").replace(alpha=2) == Version("1.2.3a2")
+        assert Version("1.2.3").replace(local="Test_1") == Version("1.2.3+test.1")
+        with pytest.raises(VersionError, match=r"'1\.2\.3\+test 1'"):
+            Version("1.2.3").replace(local="test 1")
+        assert Version("1.2.3").replace(dev=-1).dumps() == "1.2.3.dev1"
+        assert Version("1.2.3").replace(post=-1).dumps() == "1.2.3.post1"
+        assert Version("1.2.3").replace(rc=-1).dumps() == "1.2.3rc1"
+        with pytest.raises(VersionError, match=r"'-4\.2\.3'"):
+            Version("1.2.3").replace(major=-4)
+        with pytest.raises(VersionError, match=r"'-1!1\.2\.3'"):
+            Version("1.2.3").replace(epoch=-1)
 
     def test_get_stable(self) -> None:
         assert Version("1.2.3").get_stable().dumps() == "1.2.3"
@@ -105,6 +152,53 @@ class TestVersion:
         assert Version("3.4.5.dev4").get_stable().dumps() == "3.4.5"
         assert Version("4.5.6b3.dev4").get_stable().dumps() == "4.5.6"
 
+    def test_hash(self) -> None:
+        version = Version("1.2.3rc4")
+        assert hash(version) == hash(Version("1.2.3rc4"))
+        assert hash(version) == hash(Version("1.2.3.rc4"))
+        assert hash(version.copy()) == hash(version)
+        version.base = Version("1.2.4").base
+        assert hash(version) == hash(Version("1.2.4"))
+        assert len({Version("1.2.3"), Version("1.2.3.0"), Version("1.2.4")}) == 2
+
+    def test_pickle(self) -> None:
+        version = Version("1.2.3rc4+local")
+        unpickled = pickle.loads(pickle.dumps(version))  # noqa: S301
+        assert unpickled == version
+        assert unpickled.base == version.base
+        assert unpickled.bump_prerelease().dumps() == "1.2.3rc5"
+
+    def test_pickle_previous_format(self) -> None:
+        # `Version("1.2.3rc4+local.1")` pickled by newversion 3.1.0 with packaging 24.2
+        data = (
+            b"\x80\x02cnewversion.version\nVersion\nq\x00)\x81q\x01}q\x02(X\x08\x00\x00\x00_versionq"
+            b"\x03cpackaging.version\n_Version\nq\x04(K\x00K\x01K\x02K\x03\x87q\x05NX\x02\x00\x00\x00"
+            b"rcq\x06K\x04\x86q\x07NX\x05\x00\x00\x00localq\x08K\x01\x86q\ttq\n\x81q\x0bX\x04\x00\x00"
+            b"\x00_keyq\x0c(K\x00K\x01K\x02K\x03\x87q\rh\x07cpackaging._structures\nNegativeInfinityType"
+            b"\nq\x0e)\x81q\x0fcpackaging._structures\nInfinityType\nq\x10)\x81q\x11h\x0fh\x08\x86q\x12K"
+            b"\x01X\x00\x00\x00\x00q\x13\x86q\x14\x86q\x15tq\x16ub."
+        )
+        unpickled = pickle.loads(data)  # noqa: S301
+        assert unpickled == Version("1.2.3rc4+local.1")
+        assert hash(unpickled) == hash(Version("1.2.3rc4+local.1"))
+        assert unpickled.bump_prerelease().dumps() == "1.2.3rc5"
+
+    def test_sort_many(self) -> None:
+        versions = ["1.10.0", "1.2.3", "1.2.3rc1", "1.2.3.post1", "1.2.3.dev4", "1!0.1", "1.2"]
+        assert Version.sort_many(versions) == [
+            "1.2",
+            "1.2.3.dev4",
+            "1.2.3rc1",
+            "1.2.3",
+            "1.2.3.post1",
+            "1.10.0",
+            "1!0.1",
+        ]
+        assert Version.sort_many(versions) == [str(i) for i in sorted(map(Version, versions))]
+        assert Version.sort_many([]) == []
+        with pytest.raises(VersionError):
+            Version.sort_many(["1.2.3", "invalid"])
+
     def test_comparison(self) -> None:
         assert Version("1.2.32") > Version("1.2.5")
         assert Version("1.2.3") > Version("1.2.3.rc3")